@@ -1,17 +1,37 @@
 import tkinter
-from distutils.version import StrictVersion as Version
 import sys
 import os
-import platform
-import ctypes
+import subprocess
+import warnings
 from typing import Union, Tuple, Optional
 
 from .widgets.theme import ThemeManager
 from .widgets.scaling import CTkScalingBaseClass
 from .widgets.appearance_mode import CTkAppearanceModeBaseClass
 
-from customtkinter.windows.widgets.utility.utility_functions import pop_from_dict_by_set, check_kwargs_empty
+from customtkinter.windows.widgets.utility.utility_functions import pop_from_dict_by_set, check_kwargs_empty, MACOS_DARK_TITLE_BAR_SUPPORTED
 
+_IS_WIN: bool = sys.platform.startswith("win")
+_IS_MAC: bool = sys.platform == "darwin"
+
+if _IS_WIN:
+    import ctypes  # only needed for titlebar color on Windows
+
+    # resolve and declare the prototypes of the titlebar color functions once, instead of on every call
+    # (own WinDLL instances, so the prototypes of the shared ctypes.windll functions stay untouched)
+    _DWM_ATTRIBUTE_SIZE = ctypes.sizeof(ctypes.c_int)
+    try:
+        _GetParent = ctypes.WinDLL("user32").GetParent
+        _GetParent.argtypes = [ctypes.c_void_p]
+        _GetParent.restype = ctypes.c_void_p
+
+        _DwmSetWindowAttribute = ctypes.WinDLL("dwmapi").DwmSetWindowAttribute
+        _DwmSetWindowAttribute.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.POINTER(ctypes.c_int), ctypes.c_uint]
+        _DwmSetWindowAttribute.restype = ctypes.c_long
+    except Exception as err:
+        warnings.warn(f"CTk Warning: titlebar color can't be set on this system ({err})\n")
+        _GetParent = None
+        _DwmSetWindowAttribute = None  # titlebar color can't be set, window works without it
 
 class CTk(tkinter.Tk, CTkAppearanceModeBaseClass, CTkScalingBaseClass):
     """
@@ -19,11 +39,11 @@ class CTk(tkinter.Tk, CTkAppearanceModeBaseClass, CTkScalingBaseClass):
     For detailed information check out the documentation.
     """
 
-    _valid_tk_constructor_arguments: set = {"screenName", "baseName", "className", "useTk", "sync", "use"}
+    _valid_tk_constructor_arguments: frozenset = frozenset({"screenName", "baseName", "className", "useTk", "sync", "use"})
 
-    _valid_tk_configure_arguments: set = {'bd', 'borderwidth', 'class', 'menu', 'relief', 'screen',
-                                          'use', 'container', 'cursor', 'height',
-                                          'highlightthickness', 'padx', 'pady', 'takefocus', 'visual', 'width'}
+    _valid_tk_configure_arguments: frozenset = frozenset({'bd', 'borderwidth', 'class', 'menu', 'relief', 'screen',
+                                                          'use', 'container', 'cursor', 'height',
+                                                          'highlightthickness', 'padx', 'pady', 'takefocus', 'visual', 'width'})
 
     _deactivate_macos_window_header_manipulation: bool = False
     _deactivate_windows_window_header_manipulation: bool = False
@@ -46,12 +66,16 @@ class CTk(tkinter.Tk, CTkAppearanceModeBaseClass, CTkScalingBaseClass):
         self._min_height: int = 0
         self._max_width: int = 1_000_000
         self._max_height: int = 1_000_000
+        self._last_pushed_minsize: Union[Tuple[int, int], None] = None  # last scaled (width, height) passed to tkinter.Tk.minsize
+        self._last_pushed_maxsize: Union[Tuple[int, int], None] = None  # last scaled (width, height) passed to tkinter.Tk.maxsize
         self._last_resizable_args: Union[Tuple[list, dict], None] = None  # (args, kwargs)
+        self._ctk_children: set = set()  # CTk widgets with this window as master, registered by CTkBaseClass
 
         self._fg_color = ThemeManager.theme["CTk"]["fg_color"] if fg_color is None else self._check_color_type(fg_color)
 
         # set bg of tkinter.Tk
-        super().configure(bg=self._apply_appearance_mode(self._fg_color))
+        self._last_bg_color: Union[str, None] = None  # last bg color passed to tkinter.Tk.configure
+        self._update_bg_color()
 
         # set title
         self.title("CTk")
@@ -63,20 +87,23 @@ class CTk(tkinter.Tk, CTkAppearanceModeBaseClass, CTkScalingBaseClass):
         self._withdraw_called_before_window_exists = False  # indicates if withdraw() was called before window is first shown through update() or mainloop()
         self._iconify_called_before_window_exists = False  # indicates if iconify() was called before window is first shown through update() or mainloop()
         self._block_update_dimensions_event = False
+        self._pending_dimensions_update = None  # after_idle id of scheduled _do_dimensions_update call
+        self._detected_dimensions: Union[Tuple[int, int], None] = None  # latest scaled (width, height) of <Configure> event
 
         # set CustomTkinter titlebar icon (Windows only)
-        if sys.platform.startswith("win"):
+        if _IS_WIN:
             self.after(200, self._windows_set_titlebar_icon)
 
         # set titlebar color (Windows only)
-        if sys.platform.startswith("win"):
-            self._windows_set_titlebar_color(self._get_appearance_mode())
+        self._sync_titlebar_color()
 
         self.bind('<Configure>', self._update_dimensions_event)
-        self.bind('<FocusIn>', self._focus_in_event)
+        if _IS_MAC:
+            self.bind('<FocusIn>', self._focus_in_event)
 
     def destroy(self):
         self._disable_macos_dark_title_bar()
+        self._cancel_dimensions_update()
 
         # call destroy methods of super classes
         tkinter.Tk.destroy(self)
@@ -85,30 +112,64 @@ class CTk(tkinter.Tk, CTkAppearanceModeBaseClass, CTkScalingBaseClass):
 
     def _focus_in_event(self, event):
         # sometimes window looses jumps back on macOS if window is selected from Mission Control, so has to be lifted again
-        if sys.platform == "darwin":
-            self.lift()
+        # (only bound on macOS)
+        self.lift()
 
     def _update_dimensions_event(self, event=None):
+        if event is not None and event.widget is not self:
+            return  # <Configure> events of child widgets also arrive here, window size did not change
+
         if not self._block_update_dimensions_event:
+            if event is not None:
+                self._detected_dimensions = (event.width, event.height)  # size is already given by event
+
+            # coalesce all <Configure> events of one burst into a single update
+            if self._pending_dimensions_update is None:
+                self._pending_dimensions_update = self.after_idle(self._do_dimensions_update)
 
+    def _do_dimensions_update(self):
+        self._pending_dimensions_update = None
+
+        if self._block_update_dimensions_event:
+            self._detected_dimensions = None
+            return
+
+        if self._detected_dimensions is not None:
+            detected_width, detected_height = self._detected_dimensions
+            self._detected_dimensions = None
+        else:
             detected_width = super().winfo_width()  # detect current window size
             detected_height = super().winfo_height()
 
-            # detected_width = event.width
-            # detected_height = event.height
+        # adjust current size according to new size given by event,
+        # _current_width and _current_height are independent of the scale
+        self._current_width = self._reverse_window_scaling(detected_width)
+        self._current_height = self._reverse_window_scaling(detected_height)
 
-            if self._current_width != self._reverse_window_scaling(detected_width) or self._current_height != self._reverse_window_scaling(detected_height):
-                self._current_width = self._reverse_window_scaling(detected_width)  # adjust current size according to new size given by event
-                self._current_height = self._reverse_window_scaling(detected_height)  # _current_width and _current_height are independent of the scale
+    def _cancel_dimensions_update(self):
+        """ discard pending dimension update, its detected size is outdated after scaling or geometry changes """
+        if self._pending_dimensions_update is not None:
+            self.after_cancel(self._pending_dimensions_update)
+            self._pending_dimensions_update = None
+        self._detected_dimensions = None
 
     def _set_scaling(self, new_widget_scaling, new_window_scaling):
         super()._set_scaling(new_widget_scaling, new_window_scaling)
+        self._cancel_dimensions_update()  # pending size was detected with the old scaling
 
         # Force new dimensions on window by using min, max, and geometry. Without min, max it won't work.
-        super().minsize(self._apply_window_scaling(self._current_width), self._apply_window_scaling(self._current_height))
-        super().maxsize(self._apply_window_scaling(self._current_width), self._apply_window_scaling(self._current_height))
-
-        super().geometry(f"{self._apply_window_scaling(self._current_width)}x{self._apply_window_scaling(self._current_height)}")
+        scaled_width = self._apply_window_scaling(self._current_width)
+        scaled_height = self._apply_window_scaling(self._current_height)
+        try:
+            # all three in one Tcl script, to enter the interpreter only once
+            self.tk.eval(f"wm minsize {self._w} {scaled_width} {scaled_height}; "
+                         f"wm maxsize {self._w} {scaled_width} {scaled_height}; "
+                         f"wm geometry {self._w} {scaled_width}x{scaled_height}")
+        except tkinter.TclError:
+            super().minsize(scaled_width, scaled_height)
+            super().maxsize(scaled_width, scaled_height)
+            super().geometry(f"{scaled_width}x{scaled_height}")
+        self._last_pushed_minsize = self._last_pushed_maxsize = (scaled_width, scaled_height)
 
         # set new scaled min and max with delay (delay prevents weird bug where window dimensions snap to unscaled dimensions when mouse releases window)
         self.after(1000, self._set_scaled_min_max)  # Why 1000ms delay? Experience! (Everything tested on Windows 11)
@@ -121,9 +182,21 @@ class CTk(tkinter.Tk, CTkAppearanceModeBaseClass, CTkScalingBaseClass):
 
     def _set_scaled_min_max(self):
         if self._min_width is not None or self._min_height is not None:
-            super().minsize(self._apply_window_scaling(self._min_width), self._apply_window_scaling(self._min_height))
+            self._push_minsize(self._apply_window_scaling(self._min_width), self._apply_window_scaling(self._min_height))
         if self._max_width is not None or self._max_height is not None:
-            super().maxsize(self._apply_window_scaling(self._max_width), self._apply_window_scaling(self._max_height))
+            self._push_maxsize(self._apply_window_scaling(self._max_width), self._apply_window_scaling(self._max_height))
+
+    def _push_minsize(self, scaled_width: int, scaled_height: int):
+        """ calls tkinter.Tk.minsize only if the scaled values differ from the last ones passed """
+        if (scaled_width, scaled_height) != self._last_pushed_minsize:
+            super().minsize(scaled_width, scaled_height)
+            self._last_pushed_minsize = (scaled_width, scaled_height)
+
+    def _push_maxsize(self, scaled_width: int, scaled_height: int):
+        """ calls tkinter.Tk.maxsize only if the scaled values differ from the last ones passed """
+        if (scaled_width, scaled_height) != self._last_pushed_maxsize:
+            super().maxsize(scaled_width, scaled_height)
+            self._last_pushed_maxsize = (scaled_width, scaled_height)
 
     def withdraw(self):
         if self._window_exists is False:
@@ -139,7 +212,7 @@ class CTk(tkinter.Tk, CTkAppearanceModeBaseClass, CTkScalingBaseClass):
         if self._window_exists is False:
             self._window_exists = True
 
-            if sys.platform.startswith("win"):
+            if _IS_WIN:
                 if not self._withdraw_called_before_window_exists and not self._iconify_called_before_window_exists:
                     # print("window dont exists -> deiconify in update")
                     self.deiconify()
@@ -150,7 +223,7 @@ class CTk(tkinter.Tk, CTkAppearanceModeBaseClass, CTkScalingBaseClass):
         if not self._window_exists:
             self._window_exists = True
 
-            if sys.platform.startswith("win"):
+            if _IS_WIN:
                 if not self._withdraw_called_before_window_exists and not self._iconify_called_before_window_exists:
                     # print("window dont exists -> deiconify in mainloop")
                     self.deiconify()
@@ -161,36 +234,48 @@ class CTk(tkinter.Tk, CTkAppearanceModeBaseClass, CTkScalingBaseClass):
         current_resizable_values = super().resizable(width, height)
         self._last_resizable_args = ([], {"width": width, "height": height})
 
-        if sys.platform.startswith("win"):
-            self._windows_set_titlebar_color(self._get_appearance_mode())
+        self._sync_titlebar_color()
 
         return current_resizable_values
 
     def minsize(self, width: int = None, height: int = None):
+        # omitted dimension keeps its current value
+        if width is None:
+            width = self._min_width
+        if height is None:
+            height = self._min_height
+
         self._min_width = width
         self._min_height = height
         if self._current_width < width:
             self._current_width = width
         if self._current_height < height:
             self._current_height = height
-        super().minsize(self._apply_window_scaling(self._min_width), self._apply_window_scaling(self._min_height))
+        self._push_minsize(self._apply_window_scaling(self._min_width), self._apply_window_scaling(self._min_height))
 
     def maxsize(self, width: int = None, height: int = None):
+        # omitted dimension keeps its current value
+        if width is None:
+            width = self._max_width
+        if height is None:
+            height = self._max_height
+
         self._max_width = width
         self._max_height = height
         if self._current_width > width:
             self._current_width = width
         if self._current_height > height:
             self._current_height = height
-        super().maxsize(self._apply_window_scaling(self._max_width), self._apply_window_scaling(self._max_height))
+        self._push_maxsize(self._apply_window_scaling(self._max_width), self._apply_window_scaling(self._max_height))
 
     def geometry(self, geometry_string: str = None):
         if geometry_string is not None:
-            super().geometry(self._apply_geometry_scaling(geometry_string))
+            width, height, x, y = self._parse_geometry_string(geometry_string)
+            super().geometry(self._apply_geometry_scaling_parsed(width, height, x, y))
 
             # update width and height attributes
-            width, height, x, y = self._parse_geometry_string(geometry_string)
             if width is not None and height is not None:
+                self._cancel_dimensions_update()  # pending size was detected before this geometry change
                 self._current_width = max(self._min_width, min(width, self._max_width))  # bound value between min and max
                 self._current_height = max(self._min_height, min(height, self._max_height))
         else:
@@ -199,13 +284,13 @@ class CTk(tkinter.Tk, CTkAppearanceModeBaseClass, CTkScalingBaseClass):
     def configure(self, **kwargs):
         if "fg_color" in kwargs:
             self._fg_color = self._check_color_type(kwargs.pop("fg_color"))
-            super().configure(bg=self._apply_appearance_mode(self._fg_color))
+            self._update_bg_color()
 
-            for child in self.winfo_children():
+            for child in self._ctk_children:
                 try:
                     child.configure(bg_color=self._fg_color)
                 except Exception:
-                    pass
+                    pass  # don't let a single child stop the update of the other children
 
         super().configure(**pop_from_dict_by_set(kwargs, self._valid_tk_configure_arguments))
         check_kwargs_empty(kwargs)
@@ -231,19 +316,21 @@ class CTk(tkinter.Tk, CTkAppearanceModeBaseClass, CTkScalingBaseClass):
 
     @classmethod
     def _enable_macos_dark_title_bar(cls):
-        if sys.platform == "darwin" and not cls._deactivate_macos_window_header_manipulation:  # macOS
-            if Version(platform.python_version()) < Version("3.10"):
-                if Version(tkinter.Tcl().call("info", "patchlevel")) >= Version("8.6.9"):  # Tcl/Tk >= 8.6.9
-                    os.system("defaults write -g NSRequiresAquaSystemAppearance -bool No")
-                    # This command allows dark-mode for all programs
+        if MACOS_DARK_TITLE_BAR_SUPPORTED and not cls._deactivate_macos_window_header_manipulation:  # macOS
+            try:
+                subprocess.run(["defaults", "write", "-g", "NSRequiresAquaSystemAppearance", "-bool", "No"], check=False)
+                # This command allows dark-mode for all programs
+            except OSError:
+                pass
 
     @classmethod
     def _disable_macos_dark_title_bar(cls):
-        if sys.platform == "darwin" and not cls._deactivate_macos_window_header_manipulation:  # macOS
-            if Version(platform.python_version()) < Version("3.10"):
-                if Version(tkinter.Tcl().call("info", "patchlevel")) >= Version("8.6.9"):  # Tcl/Tk >= 8.6.9
-                    os.system("defaults delete -g NSRequiresAquaSystemAppearance")
-                    # This command reverts the dark-mode setting for all programs.
+        if MACOS_DARK_TITLE_BAR_SUPPORTED and not cls._deactivate_macos_window_header_manipulation:  # macOS
+            try:
+                subprocess.run(["defaults", "delete", "-g", "NSRequiresAquaSystemAppearance"], check=False)
+                # This command reverts the dark-mode setting for all programs.
+            except OSError:
+                pass
 
     def _windows_set_titlebar_color(self, color_mode: str):
         """
@@ -256,13 +343,13 @@ class CTk(tkinter.Tk, CTkAppearanceModeBaseClass, CTkScalingBaseClass):
         https://docs.microsoft.com/en-us/windows/win32/api/dwmapi/ne-dwmapi-dwmwindowattribute
         """
 
-        if sys.platform.startswith("win") and not self._deactivate_windows_window_header_manipulation:
+        if _IS_WIN and not self._deactivate_windows_window_header_manipulation and _DwmSetWindowAttribute is not None:
 
             if self._window_exists:
                 self._state_before_windows_set_titlebar_color = self.state()
                 # print("window_exists -> state_before_windows_set_titlebar_color: ", self.state_before_windows_set_titlebar_color)
 
-                if self._state_before_windows_set_titlebar_color != "iconic" or self._state_before_windows_set_titlebar_color != "withdrawn":
+                if self._state_before_windows_set_titlebar_color not in ("iconic", "withdrawn"):
                     super().withdraw()  # hide window so that it can be redrawn after the titlebar change so that the color change is visible
             else:
                 # print("window dont exists -> withdraw and update")
@@ -277,19 +364,19 @@ class CTk(tkinter.Tk, CTkAppearanceModeBaseClass, CTkScalingBaseClass):
                 return
 
             try:
-                hwnd = ctypes.windll.user32.GetParent(self.winfo_id())
+                hwnd = _GetParent(self.winfo_id())
                 DWMWA_USE_IMMERSIVE_DARK_MODE = 20
                 DWMWA_USE_IMMERSIVE_DARK_MODE_BEFORE_20H1 = 19
 
+                attribute_value = ctypes.c_int(value)  # shared by both attempts
+
                 # try with DWMWA_USE_IMMERSIVE_DARK_MODE
-                if ctypes.windll.dwmapi.DwmSetWindowAttribute(hwnd, DWMWA_USE_IMMERSIVE_DARK_MODE,
-                                                              ctypes.byref(ctypes.c_int(value)),
-                                                              ctypes.sizeof(ctypes.c_int(value))) != 0:
+                if _DwmSetWindowAttribute(hwnd, DWMWA_USE_IMMERSIVE_DARK_MODE,
+                                          ctypes.byref(attribute_value), _DWM_ATTRIBUTE_SIZE) != 0:
 
                     # try with DWMWA_USE_IMMERSIVE_DARK_MODE_BEFORE_20h1
-                    ctypes.windll.dwmapi.DwmSetWindowAttribute(hwnd, DWMWA_USE_IMMERSIVE_DARK_MODE_BEFORE_20H1,
-                                                               ctypes.byref(ctypes.c_int(value)),
-                                                               ctypes.sizeof(ctypes.c_int(value)))
+                    _DwmSetWindowAttribute(hwnd, DWMWA_USE_IMMERSIVE_DARK_MODE_BEFORE_20H1,
+                                           ctypes.byref(attribute_value), _DWM_ATTRIBUTE_SIZE)
 
             except Exception as err:
                 print(err)
@@ -298,8 +385,8 @@ class CTk(tkinter.Tk, CTkAppearanceModeBaseClass, CTkScalingBaseClass):
                 # print("window_exists -> return to original state: ", self.state_before_windows_set_titlebar_color)
                 if self._state_before_windows_set_titlebar_color == "normal":
                     self.deiconify()
-                elif self._state_before_windows_set_titlebar_color == "iconic":
-                    self.iconify()
+                elif self._state_before_windows_set_titlebar_color in ("iconic", "withdrawn"):
+                    pass  # window was not withdrawn above, so it is still in its original state
                 elif self._state_before_windows_set_titlebar_color == "zoomed":
                     self.state("zoomed")
                 else:
@@ -307,10 +394,21 @@ class CTk(tkinter.Tk, CTkAppearanceModeBaseClass, CTkScalingBaseClass):
             else:
                 pass  # wait for update or mainloop to be called
 
+    def _update_bg_color(self):
+        """ set bg of tkinter.Tk according to fg_color and appearance mode, skips the Tcl call if bg did not change """
+        bg_color = self._apply_appearance_mode(self._fg_color)
+        if bg_color != self._last_bg_color:
+            super().configure(bg=bg_color)
+            self._last_bg_color = bg_color
+
+    def _sync_titlebar_color(self):
+        """ set titlebar color according to current appearance mode (Windows only) """
+        if _IS_WIN:
+            self._windows_set_titlebar_color(self._get_appearance_mode())
+
     def _set_appearance_mode(self, mode_string: str):
         super()._set_appearance_mode(mode_string)
 
-        if sys.platform.startswith("win"):
-            self._windows_set_titlebar_color(mode_string)
+        self._sync_titlebar_color()
 
-        super().configure(bg=self._apply_appearance_mode(self._fg_color))
+        self._update_bg_color()
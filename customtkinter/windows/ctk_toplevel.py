@@ -1,16 +1,17 @@
 import tkinter
-from distutils.version import StrictVersion as Version
 import sys
 import os
-import platform
-import ctypes
+import subprocess
 from typing import Union, Tuple, Optional
 
 from .widgets.theme import ThemeManager
 from .widgets.scaling import CTkScalingBaseClass
 from .widgets.appearance_mode import CTkAppearanceModeBaseClass
 
-from customtkinter.windows.widgets.utility.utility_functions import pop_from_dict_by_set, check_kwargs_empty
+from customtkinter.windows.widgets.utility.utility_functions import pop_from_dict_by_set, check_kwargs_empty, MACOS_DARK_TITLE_BAR_SUPPORTED
+
+if sys.platform.startswith("win"):
+    import ctypes  # only needed for titlebar color on Windows
 
 
 class CTkToplevel(tkinter.Toplevel, CTkAppearanceModeBaseClass, CTkScalingBaseClass):
@@ -211,18 +212,20 @@ class CTkToplevel(tkinter.Toplevel, CTkAppearanceModeBaseClass, CTkScalingBaseCl
 
     @classmethod
     def _enable_macos_dark_title_bar(cls):
-        if sys.platform == "darwin" and not cls._deactivate_macos_window_header_manipulation:  # macOS
-            if Version(platform.python_version()) < Version("3.10"):
-                if Version(tkinter.Tcl().call("info", "patchlevel")) >= Version("8.6.9"):  # Tcl/Tk >= 8.6.9
-                    os.system("defaults write -g NSRequiresAquaSystemAppearance -bool No")
+        if MACOS_DARK_TITLE_BAR_SUPPORTED and not cls._deactivate_macos_window_header_manipulation:  # macOS
+            try:
+                subprocess.run(["defaults", "write", "-g", "NSRequiresAquaSystemAppearance", "-bool", "No"], check=False)
+            except OSError:
+                pass
 
     @classmethod
     def _disable_macos_dark_title_bar(cls):
-        if sys.platform == "darwin" and not cls._deactivate_macos_window_header_manipulation:  # macOS
-            if Version(platform.python_version()) < Version("3.10"):
-                if Version(tkinter.Tcl().call("info", "patchlevel")) >= Version("8.6.9"):  # Tcl/Tk >= 8.6.9
-                    os.system("defaults delete -g NSRequiresAquaSystemAppearance")
-                    # This command reverts the dark-mode setting for all programs.
+        if MACOS_DARK_TITLE_BAR_SUPPORTED and not cls._deactivate_macos_window_header_manipulation:  # macOS
+            try:
+                subprocess.run(["defaults", "delete", "-g", "NSRequiresAquaSystemAppearance"], check=False)
+                # This command reverts the dark-mode setting for all programs.
+            except OSError:
+                pass
 
     def _windows_set_titlebar_color(self, color_mode: str):
         """
@@ -1,12 +1,13 @@
 import sys
 import tkinter
-from distutils.version import StrictVersion as Version
 from typing import Callable
 
+from ..utility import parse_version
+
 try:
     import darkdetect
 
-    if Version(darkdetect.__version__) < Version("0.3.1"):
+    if parse_version(darkdetect.__version__) < (0, 3, 1):
         sys.stderr.write("WARNING: You have to upgrade the darkdetect library: pip3 install --upgrade darkdetect\n")
         if sys.platform != "darwin":
             exit()
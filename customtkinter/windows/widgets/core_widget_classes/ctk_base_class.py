@@ -73,6 +73,10 @@ class CTkBaseClass(tkinter.Frame, CTkAppearanceModeBaseClass, CTkScalingBaseClas
         # add configure callback to tkinter.Frame
         super().bind('<Configure>', self._update_dimensions_event)
 
+        # register at CTk master, so that fg_color changes of master get applied without iterating over all tkinter children
+        if isinstance(self.master, windows.CTk):
+            self.master._ctk_children.add(self)
+
         # overwrite configure methods of master when master is tkinter widget, so that bg changes get applied on child CTk widget as well
         if isinstance(self.master, (tkinter.Tk, tkinter.Toplevel, tkinter.Frame, tkinter.LabelFrame, ttk.Frame, ttk.LabelFrame, ttk.Notebook)) and not isinstance(self.master, CTkBaseClass):
             master_old_configure = self.master.config
@@ -97,6 +101,9 @@ class CTkBaseClass(tkinter.Frame, CTkAppearanceModeBaseClass, CTkScalingBaseClas
     def destroy(self):
         """ Destroy this and all descendants widgets. """
 
+        if isinstance(self.master, windows.CTk):
+            self.master._ctk_children.discard(self)
+
         # call destroy methods of super classes
         tkinter.Frame.destroy(self)
         CTkAppearanceModeBaseClass.destroy(self)
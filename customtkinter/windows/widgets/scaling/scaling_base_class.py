@@ -9,6 +9,10 @@ except ImportError:
 from .scaling_tracker import ScalingTracker
 from ..font import CTkFont
 
+#                 index:   1                   2           3          4             5       6
+# regex group structure: ('<width>x<height>', '<width>', '<height>', '+-<x>+-<y>', '-<x>', '-<y>')
+_GEOMETRY_RE = re.compile(r"((\d+)x(\d+))?(\+?([+-]?\d+)\+?([+-]?\d+))?")
+
 
 class CTkScalingBaseClass:
     """
@@ -25,6 +29,7 @@ class CTkScalingBaseClass:
     - _apply_font_scaling()
     - _apply_argument_scaling()
     - _apply_geometry_scaling()
+    - _apply_geometry_scaling_parsed()
     - _reverse_geometry_scaling()
     - _parse_geometry_string()
 
@@ -39,6 +44,7 @@ class CTkScalingBaseClass:
             ScalingTracker.activate_high_dpi_awareness()  # make process DPI aware
             ScalingTracker.add_window(self._set_scaling, self)  # add callback for automatic scaling changes
             self.__window_scaling = ScalingTracker.get_window_scaling(self)
+            self.__window_scaling_inv = 1.0 / self.__window_scaling
 
     def destroy(self):
         if self.__scaling_type == "widget":
@@ -50,6 +56,7 @@ class CTkScalingBaseClass:
         """ can be overridden, but super method must be called at the beginning """
         self.__widget_scaling = new_widget_scaling
         self.__window_scaling = new_window_scaling
+        self.__window_scaling_inv = 1.0 / new_window_scaling
 
     def _get_widget_scaling(self) -> float:
         return self.__widget_scaling
@@ -119,41 +126,43 @@ class CTkScalingBaseClass:
 
     @staticmethod
     def _parse_geometry_string(geometry_string: str) -> tuple:
-        #                 index:   1                   2           3          4             5       6
-        # regex group structure: ('<width>x<height>', '<width>', '<height>', '+-<x>+-<y>', '-<x>', '-<y>')
-        result = re.search(r"((\d+)x(\d+)){0,1}(\+{0,1}([+-]{0,1}\d+)\+{0,1}([+-]{0,1}\d+)){0,1}", geometry_string)
-
-        width = int(result.group(2)) if result.group(2) is not None else None
-        height = int(result.group(3)) if result.group(3) is not None else None
-        x = int(result.group(5)) if result.group(5) is not None else None
-        y = int(result.group(6)) if result.group(6) is not None else None
+        _, width, height, _, x, y = _GEOMETRY_RE.search(geometry_string).groups()
 
-        return width, height, x, y
+        return (int(width) if width is not None else None,
+                int(height) if height is not None else None,
+                int(x) if x is not None else None,
+                int(y) if y is not None else None)
 
     def _apply_geometry_scaling(self, geometry_string: str) -> str:
+        return self._apply_geometry_scaling_parsed(*self._parse_geometry_string(geometry_string))
+
+    def _apply_geometry_scaling_parsed(self, width: Union[int, None], height: Union[int, None],
+                                       x: Union[int, None], y: Union[int, None]) -> str:
+        """ same as _apply_geometry_scaling(), but takes the values returned by _parse_geometry_string() """
         assert self.__scaling_type == "window"
 
-        width, height, x, y = self._parse_geometry_string(geometry_string)
+        scaling = self.__window_scaling
 
         if x is None and y is None:  # no <x> and <y> in geometry_string
-            return f"{round(width * self.__window_scaling)}x{round(height * self.__window_scaling)}"
+            return f"{round(width * scaling)}x{round(height * scaling)}"
 
         elif width is None and height is None:  # no <width> and <height> in geometry_string
             return f"+{x}+{y}"
 
         else:
-            return f"{round(width * self.__window_scaling)}x{round(height * self.__window_scaling)}+{x}+{y}"
+            return f"{round(width * scaling)}x{round(height * scaling)}+{x}+{y}"
 
     def _reverse_geometry_scaling(self, scaled_geometry_string: str) -> str:
         assert self.__scaling_type == "window"
 
         width, height, x, y = self._parse_geometry_string(scaled_geometry_string)
+        scaling_inv = self.__window_scaling_inv
 
         if x is None and y is None:  # no <x> and <y> in geometry_string
-            return f"{round(width / self.__window_scaling)}x{round(height / self.__window_scaling)}"
+            return f"{round(width * scaling_inv)}x{round(height * scaling_inv)}"
 
         elif width is None and height is None:  # no <width> and <height> in geometry_string
             return f"+{x}+{y}"
 
         else:
-            return f"{round(width / self.__window_scaling)}x{round(height / self.__window_scaling)}+{x}+{y}"
+            return f"{round(width * scaling_inv)}x{round(height * scaling_inv)}+{x}+{y}"
@@ -1 +1 @@
-from .utility_functions import pop_from_dict_by_set, check_kwargs_empty
+from .utility_functions import pop_from_dict_by_set, check_kwargs_empty, parse_version, MACOS_DARK_TITLE_BAR_SUPPORTED
@@ -1,3 +1,7 @@
+import re
+import sys
+import tkinter
+
 
 def pop_from_dict_by_set(dictionary: dict, valid_keys: set) -> dict:
     """ remove and create new dict with key value pairs of dictionary, where key is in valid_keys """
@@ -20,3 +24,25 @@ def check_kwargs_empty(kwargs_dict, raise_error=False) -> bool:
             return True
     else:
         return False
+
+
+def parse_version(version_string: str) -> tuple:
+    """ returns leading numeric components of version_string as tuple of ints, for example '8.7a5' -> (8, 7) """
+    match = re.match(r"\d+(\.\d+)*", version_string.strip())
+    if match is None:
+        return ()
+    return tuple(int(part) for part in match.group().split("."))
+
+
+def _check_macos_dark_title_bar_support() -> bool:
+    """ dark titlebar manipulation on macOS is only needed and possible for Python < 3.10 with Tcl/Tk >= 8.6.9 """
+    if sys.platform != "darwin" or sys.version_info[:2] >= (3, 10):
+        return False
+    try:
+        return parse_version(tkinter.Tcl().call("info", "patchlevel")) >= (8, 6, 9)
+    except Exception:
+        return False
+
+
+# both versions can't change at runtime, so check them once instead of on every window creation and destruction
+MACOS_DARK_TITLE_BAR_SUPPORTED: bool = _check_macos_dark_title_bar_support()
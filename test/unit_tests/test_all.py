@@ -1,7 +1,9 @@
 from test_ctk import TestCTk
 from test_ctk_toplevel import TestCTkToplevel
 from test_ctk_button import TestCTkButton
+from test_utility_functions import TestUtilityFunctions
 
 TestCTk().main()
 TestCTkToplevel().main()
 TestCTkButton().main()
+TestUtilityFunctions().main()
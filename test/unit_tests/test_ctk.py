@@ -22,6 +22,12 @@ class TestCTk():
         self.root_ctk.after(start_time, self.test_geometry)
         start_time += 100
 
+        self.root_ctk.after(start_time, self.test_min_max_size)
+        start_time += 100
+
+        self.root_ctk.after(start_time, self.test_parse_geometry_string)
+        start_time += 100
+
         self.root_ctk.after(start_time, self.test_scaling)
         start_time += 100
 
@@ -57,6 +63,54 @@ class TestCTk():
         assert self.root_ctk.current_width == 500 and self.root_ctk.current_height == 600
         print("successful")
 
+    def test_min_max_size(self):
+        print(" -> test_min_max_size: ", end="")
+        self.root_ctk.minsize(300, 200)
+        self.root_ctk.minsize(height=250)  # omitted width keeps its value
+        assert self.root_ctk._min_width == 300 and self.root_ctk._min_height == 250
+
+        last_pushed_minsize = self.root_ctk._last_pushed_minsize
+        self.root_ctk.minsize(300, 250)  # identical call is not passed to tkinter again
+        assert self.root_ctk._last_pushed_minsize is last_pushed_minsize
+
+        self.root_ctk.maxsize(1000, 900)
+        self.root_ctk.maxsize(width=800)  # omitted height keeps its value
+        assert self.root_ctk._max_width == 800 and self.root_ctk._max_height == 900
+
+        last_pushed_maxsize = self.root_ctk._last_pushed_maxsize
+        self.root_ctk.maxsize(800, 900)
+        assert self.root_ctk._last_pushed_maxsize is last_pushed_maxsize
+
+        self.root_ctk.minsize(300, 400)
+        self.root_ctk.maxsize(1000, 1000)
+        print("successful")
+
+    def test_parse_geometry_string(self):
+        print(" -> test_parse_geometry_string: ", end="")
+        parse = self.root_ctk._parse_geometry_string
+
+        # valid geometry strings
+        assert parse("100x200") == (100, 200, None, None)
+        assert parse("+10+20") == (None, None, 10, 20)
+        assert parse("-10-20") == (None, None, -10, -20)
+        assert parse("-5+6") == (None, None, -5, 6)
+        assert parse("100x200+10+20") == (100, 200, 10, 20)
+        assert parse("100x200-10-20") == (100, 200, -10, -20)
+        assert parse("100x200+-10+-20") == (100, 200, -10, -20)
+        assert parse("12x34+1-2") == (12, 34, 1, -2)
+        assert parse("300x400+0+0") == (300, 400, 0, 0)
+        assert parse("") == (None, None, None, None)
+
+        # malformed geometry strings, same results as the regex
+        assert parse("abc") == (None, None, None, None)
+        assert parse("+5") == (None, None, None, None)
+        assert parse("100x200+5") == (100, 200, None, None)
+        assert parse(" 100x200") == (None, None, None, None)
+        assert parse("1_000x200") == (None, None, None, None)
+        assert parse("100x200+ 5+6") == (100, 200, None, None)
+        assert parse("100x200+_5+6") == (100, 200, None, None)
+        print("successful")
+
     def test_scaling(self):
         print(" -> test_scaling: ", end="")
 
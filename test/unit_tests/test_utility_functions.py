@@ -0,0 +1,24 @@
+from customtkinter.windows.widgets.utility import parse_version
+
+
+class TestUtilityFunctions():
+    def main(self):
+        self.execute_tests()
+
+    def execute_tests(self):
+        print(f"\n{self.__class__.__name__} started:")
+        self.test_parse_version()
+
+    def test_parse_version(self):
+        print(" -> test_parse_version: ", end="")
+        assert parse_version("8.6.9") == (8, 6, 9)
+        assert parse_version("8.6.12") == (8, 6, 12)
+        assert parse_version("8.6.12") > parse_version("8.6.9")
+        assert parse_version("8.7a5") == (8, 7)  # pre-release, only leading numeric components
+        assert parse_version("9.0b1") == (9, 0)
+        assert parse_version("") == ()
+        print("successful")
+
+
+if __name__ == "__main__":
+    TestUtilityFunctions().main()